@@ -1,4 +1,2 @@
-print("Hello, Signals and Systems with Python!")
-
-
-
+if __name__ == "__main__":
+    print("Hello, Signals and Systems with Python!")
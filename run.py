@@ -9,6 +9,10 @@ provided by my signals.py file. in short what it does is:
 """
 
 import numpy as np
+import matplotlib
+
+#Only PNG files are written, so use the non-interactive backend (no GUI start-up per figure)
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 # Import transformation utilities and signal generators
@@ -34,6 +38,7 @@ FILL = 0.0        # Fill value for undefined regions after interpolation
 
 
 def plot_and_save(
+    fig, ax,
     t_orig, y_orig,
     t_shifted, y_shifted,
     t_scaled, y_scaled,
@@ -43,6 +48,8 @@ def plot_and_save(
     Plots original, time-shifted, and time-scaled versions of a signal.
 
     Parameters:
+        fig (matplotlib.figure.Figure): Figure to draw into (reused between plots)
+        ax (matplotlib.axes.Axes): Axes of fig, cleared before drawing
         t_orig (np.ndarray): Original time values
         y_orig (np.ndarray): Original signal values
         t_shifted (np.ndarray): Time values after shifting
@@ -52,27 +59,27 @@ def plot_and_save(
         title (str): Plot title
         out_file (str): Output file path for PNG
     """
-    plt.figure(figsize=(10, 5.5))
-    plt.plot(t_orig, y_orig, label="Original", lw=1.8)
-    plt.plot(t_shifted, y_shifted, '--', label=f"Shifted (τ={TAU}s)", lw=1.5)
-    plt.plot(t_scaled, y_scaled, ':', label=f"Scaled (a={A})", lw=1.5)
-
-    plt.title(title)
-    plt.xlabel("Time [s]")
-    plt.ylabel("Amplitude")
-    plt.grid(alpha=0.3, linestyle='--')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_file, dpi=150)
-    plt.close()
+    ax.cla()
+    ax.plot(t_orig, y_orig, label="Original", lw=1.8)
+    ax.plot(t_shifted, y_shifted, '--', label=f"Shifted (τ={TAU}s)", lw=1.5)
+    ax.plot(t_scaled, y_scaled, ':', label=f"Scaled (a={A})", lw=1.5)
+
+    ax.set_title(title)
+    ax.set_xlabel("Time [s]")
+    ax.set_ylabel("Amplitude")
+    ax.grid(alpha=0.3, linestyle='--')
+    ax.legend()
+    fig.savefig(out_file, dpi=150)
     print(f"Saved plot to: {out_file}")
 
 
-def plot_combined(t_orig, y_orig, t_comb, y_comb, title, out_file):
+def plot_combined(fig, ax, t_orig, y_orig, t_comb, y_comb, title, out_file):
     """
     Plots original signal versus a combined shift-and-scale transformation.
 
     Parameters:
+        fig (matplotlib.figure.Figure): Figure to draw into (reused between plots)
+        ax (matplotlib.axes.Axes): Axes of fig, cleared before drawing
         t_orig (np.ndarray): Original time vector
         y_orig (np.ndarray): Original signal
         t_comb (np.ndarray): Transformed time vector
@@ -80,18 +87,16 @@ def plot_combined(t_orig, y_orig, t_comb, y_comb, title, out_file):
         title (str): Plot title
         out_file (str): Output filename
     """
-    plt.figure(figsize=(10, 5.5))
-    plt.plot(t_orig, y_orig, label="Original", lw=1.8)
-    plt.plot(t_comb, y_comb, "--", label=f"Combined (a={A}, τ={TAU})", lw=1.5)
-
-    plt.title(title)
-    plt.xlabel("Time [s]")
-    plt.ylabel("Amplitude")
-    plt.grid(alpha=0.3, linestyle="--")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_file, dpi=150)
-    plt.close()
+    ax.cla()
+    ax.plot(t_orig, y_orig, label="Original", lw=1.8)
+    ax.plot(t_comb, y_comb, "--", label=f"Combined (a={A}, τ={TAU})", lw=1.5)
+
+    ax.set_title(title)
+    ax.set_xlabel("Time [s]")
+    ax.set_ylabel("Amplitude")
+    ax.grid(alpha=0.3, linestyle="--")
+    ax.legend()
+    fig.savefig(out_file, dpi=150)
     print(f"Saved plot to: {out_file}")
 
 
@@ -110,8 +115,12 @@ def main():
     t_sin_comb, y_sin_comb = time_shift_and_scale(t_sin, y_sin, TAU, A, fill=FILL)
     t_tri_comb, y_tri_comb = time_shift_and_scale(t_tri, y_tri, TAU, A, fill=FILL)
 
-    #Visualization of the output
+    #Visualization of the output, all four plots drawn into one reused figure
+    #(in-process: starting a worker process costs more than rendering a plot)
+    fig, ax = plt.subplots(figsize=(10, 5.5), constrained_layout=True)
+
     plot_and_save(
+        fig, ax,
         t_sin, y_sin,
         t_sin_shifted, y_sin_shifted,
         t_sin_scaled, y_sin_scaled,
@@ -120,6 +129,7 @@ def main():
     )
 
     plot_combined(
+        fig, ax,
         t_sin, y_sin,
         t_sin_comb, y_sin_comb,
         title="Sine Wave: Original vs Combined (Shift + Scale)",
@@ -127,6 +137,7 @@ def main():
     )
 
     plot_and_save(
+        fig, ax,
         t_tri, y_tri,
         t_tri_shifted, y_tri_shifted,
         t_tri_scaled, y_tri_scaled,
@@ -135,15 +146,18 @@ def main():
     )
 
     plot_combined(
+        fig, ax,
         t_tri, y_tri,
         t_tri_comb, y_tri_comb,
         title="Triangle Wave: Original vs Combined (Shift + Scale)",
         out_file="triangle_combined.png"
     )
+    plt.close(fig)
 
-    #Basic verification  of the output
-    print("First 10 samples of sine:", np.round(y_sin[:10], 6))
-    print("First 10 samples of triangle:", np.round(y_tri[:10], 6))
+    #Basic verification  of the output, printed at 6 decimals without rounding copies of the arrays
+    with np.printoptions(precision=6, suppress=True):
+        print("First 10 samples of sine:", y_sin[:10])
+        print("First 10 samples of triangle:", y_tri[:10])
 
 
 if __name__ == "__main__":
@@ -1,8 +1,64 @@
 
+import inspect
+import math
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+
 import numpy as np
 
+#Sample dtype for generated and resampled signals; single precision is plenty for plotting.
+#Time vectors stay float64, since they set the interpolation positions.
+DTYPE = np.float32
+
+#numexpr is optional: it fuses the waveform expressions into one multithreaded pass
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+#Numba kernels are optional too; when present they take precedence over numexpr
+try:
+    from signals_numba import sine_kernel, triangle_kernel, uniform_interp_kernel
+except ImportError:
+    sine_kernel = triangle_kernel = uniform_interp_kernel = None
+
+
+def set_num_threads(n: int) -> None:
+    """
+    Set the number of threads numexpr uses for the waveform expressions.
+
+    Parameters:
+        n (int): Number of threads. Ignored if numexpr is not installed.
+    """
+    if ne is not None:
+        ne.set_num_threads(n)
+
+
+#Functions to create a uniform time vector
+def _timebase_params(t_start: float, t_end: float, fs: float):
+    """
+    Computes the parameters of the uniform grid t_start + k/fs, k = 0..N-1, on [t_start, t_end).
+
+    Parameters:
+        t_start (float): Start time in seconds.
+        t_end (float): End time in seconds (exclusive).
+        fs (float): Sampling frequency in Hz (must be > 0).
+
+    Returns:
+        tuple (float, float, int): First sample time t0, spacing dt and sample count N.
+    """
+    if fs <= 0:
+        raise ValueError("Sampling rate fs must be > 0.")
+    if t_end <= t_start:
+        raise ValueError("End time must be greater than start time.")
+
+    #Number of samples strictly before t_end; the relative tolerance keeps e.g. 0.7 s at 10 Hz at 7, not 8.
+    #t_start itself always lies in the range, so even a span far below 1/fs has one sample
+    x = (t_end - t_start) * fs
+    n = max(1, int(math.ceil(x - 1e-9 * max(1.0, abs(x)))))
+    return float(t_start), 1.0 / fs, n
+
 
-#Function to create a uniform time vector
 def _make_timebase(t_start: float, t_end: float, fs: float) -> np.ndarray:
     """
     Generates a uniform time vector from t_start to t_end with sampling rate fs.
@@ -15,21 +71,118 @@ def _make_timebase(t_start: float, t_end: float, fs: float) -> np.ndarray:
     Returns:
         np.ndarray: Time samples spaced by 1/fs.
     """
-    if fs <= 0:
-        raise ValueError("Sampling rate fs must be > 0.")
-    if t_end <= t_start:
-        raise ValueError("End time must be greater than start time.")
+    t0, dt, n = _timebase_params(t_start, t_end, fs)
+
+    #Integer sample index times dt, so the length is fixed and no float step accumulates
+    return t0 + dt * np.arange(n, dtype=np.float64)
+
+
+#Lazy uniform time vector
+
+@dataclass
+class TimeBase:
+    """
+    Uniform time vector t0 + k·dt, k = 0..n-1, stored by its parameters only.
+
+    The samples are computed when the object is converted with np.asarray (which
+    matplotlib does when plotting) or indexed, so passing one around costs O(1).
+
+    Attributes:
+        t0 (float): Time of the first sample in seconds.
+        dt (float): Sample spacing in seconds.
+        n (int): Number of samples.
+    """
+    t0: float
+    dt: float
+    n: int
+
+    def __array__(self, dtype=None, copy=None):
+        t = self.t0 + self.dt * np.arange(self.n, dtype=np.float64)
+        return t if dtype is None else t.astype(dtype, copy=False)
 
-    dt = 1.0 / fs
-    return np.arange(t_start, t_end, dt)
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, key):
+        #Single samples are computed directly; slices and masks go through the full array
+        if isinstance(key, (int, np.integer)):
+            k = key + self.n if key < 0 else key
+            if not 0 <= k < self.n:
+                raise IndexError("TimeBase index out of range.")
+            return self.t0 + self.dt * k
+        return np.asarray(self)[key]
 
 
 #Function to generate signal
 
+def _read_only(*arrays):
+    """
+    Mark arrays as read-only so cached results cannot be modified in place by callers.
+    """
+    for arr in arrays:
+        arr.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=32)
+def _sine_core(freq, t0, t1, amp, fs, phase):
+    t = _make_timebase(t0, t1, fs)
+
+    y = np.empty(t.shape[0], dtype=DTYPE)
+
+    if sine_kernel is not None:
+        start, dt, n = _timebase_params(t0, t1, fs)
+        sine_kernel(y, start, dt, n, freq, amp, phase)
+    elif ne is not None:
+        pi = np.pi
+        ne.evaluate("amp * sin(2 * pi * freq * t + phase)", out=y, casting="same_kind")
+    else:
+        #Phase argument kept in one float64 scratch buffer (float32 loses phase on long signals),
+        #then sin and the amplitude are applied straight into y
+        arg = np.multiply(t, 2 * np.pi * freq)
+        arg += phase
+        np.sin(arg, out=y, casting="same_kind")
+        y *= amp
+
+    return _read_only(t, y)
+
+
+@lru_cache(maxsize=32)
+def _triangle_core(freq, t0, t1, amp, fs):
+    t = _make_timebase(t0, t1, fs)
+
+    tri = np.empty(t.shape[0], dtype=DTYPE)
+
+    if triangle_kernel is not None:
+        start, dt, n = _timebase_params(t0, t1, fs)
+        triangle_kernel(tri, start, dt, n, freq, amp)
+    elif ne is not None:
+        #numexpr has no %, so the phase fraction is written as x - floor(x)
+        ne.evaluate("amp * (2.0 * abs(2.0 * (freq * t - floor(freq * t)) - 1.0) - 1.0)",
+                    out=tri, casting="same_kind")
+    else:
+        #Phase as a 32-bit fixed-point fraction of a cycle; the int64 -> uint32 cast wraps it to [0, 1)
+        phase = np.multiply(t, freq * 2.0**32).astype(np.int64).astype(np.uint32)
+
+        #Read as int32 the second half of the cycle is negative, so s ^ (s >> 31) ≈ |s| is the
+        #distance to the nearest cycle start, from 0 up to 2^31 (half a cycle)
+        signed = phase.view(np.int32)
+        dist = signed ^ (signed >> 31)
+
+        #Triangle from +amp at the cycle start down to -amp at half a cycle
+        np.multiply(dist, DTYPE(2.0 * amp / 2**31), out=tri, casting="same_kind")
+        np.subtract(DTYPE(amp), tri, out=tri)
+
+    return _read_only(t, tri)
+
+
 def sine_signal(freq: float, t0: float, t1: float, amp: float, fs: float, phase: float = 0.0):
     """
     Generate a sinusoidal waveform: y(t) = A·sin(2πft + φ)
 
+    Results are cached on the parameters, so the returned arrays are shared
+    between calls and read-only; use .copy() before modifying them.
+
     Parameters:
         freq (float): Frequency in Hz.
         t0 (float): Start time (seconds).
@@ -39,18 +192,18 @@ def sine_signal(freq: float, t0: float, t1: float, amp: float, fs: float, phase:
         phase (float): Phase offset in radians.
 
     Returns:
-        tuple (np.ndarray, np.ndarray): Time vector and signal vector.
+        tuple (np.ndarray, np.ndarray): Time vector and signal vector (read-only).
     """
-    t = _make_timebase(t0, t1, fs)
-    y = amp * np.sin(2 * np.pi * freq * t + phase)
-
-    return t, y
+    return _sine_core(freq, t0, t1, amp, fs, phase)
 
 
 def triangle_signal(freq: float, t0: float, t1: float, amp: float, fs: float):
     """
     Generate a symmetric triangular waveform over time base.
 
+    Results are cached on the parameters, so the returned arrays are shared
+    between calls and read-only; use .copy() before modifying them.
+
     Parameters:
         freq (float): Frequency in Hz.
         t0 (float): Start time (seconds).
@@ -59,47 +212,160 @@ def triangle_signal(freq: float, t0: float, t1: float, amp: float, fs: float):
         fs (float): Sampling rate in Hz.
 
     Returns:
-        tuple (np.ndarray, np.ndarray): Time vector and signal vector.
+        tuple (np.ndarray, np.ndarray): Time vector and signal vector (read-only).
     """
-    t = _make_timebase(t0, t1, fs)
+    return _triangle_core(freq, t0, t1, amp, fs)
+
+
+#Functions to interpolate on uniform and non-uniform grids
+
+def _is_uniform(t) -> bool:
+    """
+    Checks that t is a uniform grid: a TimeBase, or an array whose steps all equal the first
+    one and whose last sample sits where that step predicts.
+    """
+    if isinstance(t, TimeBase):
+        return True
+    n = len(t)
+    if n < 2:
+        return False
+    dt = t[1] - t[0]
+
+    #Tolerances are in units of the step (plus float rounding of t itself), not relative to
+    #the time values, so a gap is still caught when t carries a large offset such as epoch seconds
+    tol = 1e-6 * abs(dt) + 4 * np.spacing(max(abs(t[0]), abs(t[-1])))
+    #Every step is checked, since a single irregular step anywhere sends the fast paths off the grid;
+    #the endpoint check catches a drift that stays within tol on each step
+    steps_equal = np.all(np.abs(np.diff(t) - dt) <= tol)
+    end_on_grid = abs(t[-1] - t[0] - (n - 1) * dt) <= n * tol
+    return bool(steps_equal and end_on_grid)
+
+
+def _grid_params(t):
+    """
+    Returns (t0, dt, n) of a uniform time vector given as a TimeBase or an array.
+    """
+    if isinstance(t, TimeBase):
+        return t.t0, t.dt, t.n
+    return t[0], t[1] - t[0], len(t)
+
+
+def _interp(query: np.ndarray, t, y: np.ndarray, fill: float) -> np.ndarray:
+    """
+    Linear interpolation of y(t) at the query points, with fill outside [t[0], t[-1]].
+
+    Used for non-uniform time vectors and by _affine_resample when Numba is missing;
+    np.interp's binary search is already compiled, so it is only wrapped to return DTYPE.
+
+    Parameters:
+        query (np.ndarray): Time points to evaluate.
+        t (np.ndarray or TimeBase): Increasing time vector of y.
+        y (np.ndarray): Signal values.
+        fill (float): Fill value for out-of-domain samples.
 
-    #Function to make the phase ranges from 0 to 1
-    frac = (freq * t) % 1.0
+    Returns:
+        np.ndarray: Interpolated values at the query points.
+    """
+    return np.interp(query, t, y, left=fill, right=fill).astype(DTYPE, copy=False)
+
+
+def _affine_resample(y: np.ndarray, t0: float, dt: float, n: int, a: float, tau: float, fill: float) -> np.ndarray:
+    """
+    Resample y, sampled on the grid t0 + k·dt, at a·t - τ for every grid time t.
+
+    Shared by time_scale (τ = 0) and time_shift_and_scale.
+
+    Parameters:
+        y (np.ndarray): Signal values on the grid.
+        t0 (float): Time of the first sample.
+        dt (float): Sample spacing in seconds.
+        n (int): Number of samples.
+        a (float): Time scaling factor.
+        tau (float): Time shift in seconds.
+        fill (float): Fill value for out-of-domain samples.
+
+    Returns:
+        np.ndarray: Resampled signal of length n.
+    """
+    if uniform_interp_kernel is not None:
+        out = np.empty(n, dtype=DTYPE)
+        uniform_interp_kernel(out, np.ascontiguousarray(y, dtype=DTYPE), a, tau, t0, dt, n, fill)
+        return out
 
-    #Triangle scaled to [-1, 1] then to [-amp, amp]
-    tri = 2.0 * np.abs(2.0 * frac - 1.0) - 1.0
+    #Query times a·t - τ built in a single buffer
+    k = np.arange(n, dtype=np.float64)
+    if ne is not None:
+        query = ne.evaluate("a * (t0 + k * dt) - tau")
+    else:
+        query = np.multiply(k, dt, out=k)
+        query += t0
+        query *= a
+        query -= tau
 
-    return t, amp * tri
+    #Without the kernel, np.interp on the materialized grid beats computing the indices in NumPy
+    return _interp(query, TimeBase(t0, dt, y.shape[0]), y, fill)
 
 
 #Functions to create time-domains 
 
+def _validate_affine(needs_a: bool = False):
+    """
+    Decorator for the time-domain transforms: checks that t and y have the same length
+    and, if needs_a is set, that the scaling factor a is nonzero, then calls the function.
+
+    Parameters:
+        needs_a (bool): Whether the wrapped function takes a scaling factor 'a'.
+    """
+    def decorator(fn):
+        #Position of 'a' is looked up once here, not on every call
+        a_index = list(inspect.signature(fn).parameters).index("a") if needs_a else None
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            t = args[0] if len(args) > 0 else kwargs.get("t")
+            y = args[1] if len(args) > 1 else kwargs.get("y")
+            if t is not None and y is not None and len(t) != y.shape[0]:
+                raise ValueError("Length mismatch between time and signal arrays.")
+            if needs_a:
+                a = args[a_index] if len(args) > a_index else kwargs.get("a")
+                if a == 0:
+                    raise ValueError("Scaling factor 'a' must be nonzero.")
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@_validate_affine()
 def time_shift(t: np.ndarray, y: np.ndarray, tau: float):
     """
     Apply a pure time shift to signal (non-interpolative).
     x(t) -> x(t - τ)
 
     Parameters:
-        t (np.ndarray): Time vector.
+        t (np.ndarray or TimeBase): Time vector.
         y (np.ndarray): Signal values.
         tau (float): Time shift in seconds (positive = delay).
 
     Returns:
-        tuple (np.ndarray, np.ndarray): Shifted time vector and original signal.
+        tuple (TimeBase or np.ndarray, np.ndarray): Shifted time vector and original signal.
+            The time vector is a lazy TimeBase when t is uniform.
     """
-    if t.shape[0] != y.shape[0]:
-        raise ValueError("Length mismatch between time and signal arrays.")
-
-    #To ensure no resampling
+    #To ensure no resampling; a uniform shifted grid is only materialized when it is used
+    if _is_uniform(t):
+        t0, dt, n = _grid_params(t)
+        return TimeBase(t0 + tau, dt, n), y
     return t + tau, y
 
 
+@_validate_affine(needs_a=True)
 def time_scale(t: np.ndarray, y: np.ndarray, a: float, fill: float = 0.0):
     """
     Apply time scaling via interpolation: x(t) -> x(a·t)
 
     Parameters:
-        t (np.ndarray): Original time vector.
+        t (np.ndarray or TimeBase): Original time vector.
         y (np.ndarray): Signal values.
         a (float): Time scaling factor (a > 1 compresses, a < 1 stretches).
         fill (float): Fill value for extrapolated regions.
@@ -107,24 +373,22 @@ def time_scale(t: np.ndarray, y: np.ndarray, a: float, fill: float = 0.0):
     Returns:
         tuple (np.ndarray, np.ndarray): Original time vector and resampled signal.
     """
-    if a == 0:
-        raise ValueError("Scaling factor 'a' must be nonzero.")
-    if t.shape[0] != y.shape[0]:
-        raise ValueError("Input time and signal arrays must have same length.")
-
-    #Interpolation points shifted by the scaling factor
-    query_points = a * t
-    y_scaled = np.interp(query_points, t, y, left=fill, right=fill)
+    #Pure scaling is the affine remap with no shift; non-uniform t falls back to a searched interpolation
+    if _is_uniform(t):
+        y_scaled = _affine_resample(y, *_grid_params(t), a, 0.0, fill)
+    else:
+        y_scaled = _interp(a * t, t, y, fill)
 
     return t, y_scaled
 
 
+@_validate_affine(needs_a=True)
 def time_shift_and_scale(t: np.ndarray, y: np.ndarray, tau: float, a: float, fill: float = 0.0):
     """
     Apply combined affine time transform: x(t) -> x(a·t - τ)
 
     Parameters:
-        t (np.ndarray): Time vector.
+        t (np.ndarray or TimeBase): Time vector.
         y (np.ndarray): Signal values.
         tau (float): Time shift in seconds.
         a (float): Time scaling factor.
@@ -133,13 +397,10 @@ def time_shift_and_scale(t: np.ndarray, y: np.ndarray, tau: float, a: float, fil
     Returns:
         tuple (np.ndarray, np.ndarray): Time vector and transformed signal.
     """
-    if a == 0:
-        raise ValueError("Scaling factor 'a' must not be zero.")
-    if t.shape[0] != y.shape[0]:
-        raise ValueError("Length mismatch between t and y arrays.")
-
     #Combined time remapping in order to rescale then shift
-    query = a * t - tau
-    y_trans = np.interp(query, t, y, left=fill, right=fill)
+    if _is_uniform(t):
+        y_trans = _affine_resample(y, *_grid_params(t), a, tau, fill)
+    else:
+        y_trans = _interp(a * t - tau, t, y, fill)
 
-    return t, y_trans
\ No newline at end of file
+    return t, y_trans
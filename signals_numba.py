@@ -0,0 +1,68 @@
+"""
+signals_numba.py
+
+Numba-compiled kernels for the loops in signals.py. Every kernel works on the
+uniform grid t[i] = t0 + i·dt directly, so the time vector never has to be read,
+and writes into an output array that the caller preallocates.
+
+The signatures are given explicitly so the kernels are compiled when this module
+is imported (and cached on disk afterwards) instead of on the first call.
+"""
+
+import math
+
+from numba import njit, prange, types
+
+#Signal arrays are float32 (signals.DTYPE); inputs may be writable or read-only
+#(signals.py caches its outputs read-only). Grid parameters stay float64.
+#Inputs are C-contiguous, so each case matches exactly one signature (with "A" layout a
+#writable array could also be converted to the read-only type, and the overload is ambiguous).
+_F4 = types.float32[:]
+_F4_C = types.float32[::1]
+_F4_C_RO = types.Array(types.float32, 1, "C", readonly=True)
+
+
+@njit("void(f4[:], f8, f8, i8, f8, f8, f8)", parallel=True, fastmath=True, cache=True)
+def sine_kernel(out, t0, dt, n, freq, amp, phase):
+    """
+    Fill out[:n] with amp·sin(2πf(t0 + i·dt) + φ).
+    """
+    w = 2.0 * math.pi * freq
+    for i in prange(n):
+        out[i] = amp * math.sin(w * (t0 + i * dt) + phase)
+
+
+@njit("void(f4[:], f8, f8, i8, f8, f8)", parallel=True, fastmath=True, cache=True)
+def triangle_kernel(out, t0, dt, n, freq, amp):
+    """
+    Fill out[:n] with a symmetric triangle wave of peak amplitude amp.
+    """
+    for i in prange(n):
+        x = freq * (t0 + i * dt)
+        frac = x - math.floor(x)
+        out[i] = amp * (2.0 * abs(2.0 * frac - 1.0) - 1.0)
+
+
+#No fastmath here: contracting a·t - τ into an FMA moves samples across the grid edges
+@njit(
+    [types.void(_F4, y_type, types.float64, types.float64, types.float64, types.float64, types.int64, types.float64)
+     for y_type in (_F4_C, _F4_C_RO)],
+    parallel=True, cache=True,
+)
+def uniform_interp_kernel(out, y, a, tau, t0, dt, n, fill):
+    """
+    Fill out[:n] with y linearly interpolated at a·(t0 + i·dt) - τ.
+
+    y is sampled on the same grid t0 + k·dt; points outside it are set to fill.
+    """
+    last = y.shape[0] - 1
+    t_last = t0 + last * dt
+    for i in prange(n):
+        x = a * (t0 + i * dt) - tau
+        if x < t0 or x > t_last:
+            out[i] = fill
+        else:
+            pos = (x - t0) / dt
+            k = min(int(math.floor(pos)), last - 1)
+            frac = pos - k
+            out[i] = y[k] * (1.0 - frac) + y[k + 1] * frac
@@ -3,6 +3,11 @@ import math
 
 from signals import (
     _make_timebase,
+    _timebase_params,
+    _affine_resample,
+    _interp,
+    _is_uniform,
+    TimeBase,
     sine_signal,
     triangle_signal,
     time_shift,
@@ -14,11 +19,23 @@ from signals import (
 RTOL = 1e-7
 ATOL = 1e-12
 
+# Signal samples are float32 (signals.DTYPE), so they are compared at single precision;
+# time vectors stay float64 and use the strict tolerances above
+SAMPLE_RTOL = 1e-6
+SAMPLE_ATOL = 1e-6
+
 def almost_equal(a, b, rtol=RTOL, atol=ATOL):
     """
     Wrapper around np.allclose with stricter default tolerances.
     """
     return np.allclose(a, b, rtol=rtol, atol=atol)
+
+
+def samples_equal(a, b):
+    """
+    np.allclose at the float32 sample tolerances.
+    """
+    return almost_equal(a, b, rtol=SAMPLE_RTOL, atol=SAMPLE_ATOL)
     
 # Timebase Tests
 def test_make_timebase_basic():
@@ -32,6 +49,21 @@ def test_make_timebase_basic():
     assert t[-1] < 1.0  # Should not include the endpoint
 
 
+def test_make_timebase_length_is_exact():
+    """
+    The sample count should be the number of grid points before t_end, without float step drift.
+    """
+    assert len(_make_timebase(0.0, 0.7, 10.0)) == 7     # 0.7 * 10 rounds to just above 7
+    assert len(_make_timebase(0.0, 0.29, 100.0)) == 29  # 0.29 * 100 rounds to just below 29
+    assert len(_make_timebase(0.0, 0.25, 10.0)) == 3    # t_end between grid points
+    assert np.array_equal(_make_timebase(0.0, 1e-12, 1.0), [0.0])  # span far below 1/fs
+
+    t0, dt, n = _timebase_params(0.5, 2.5, 200.0)
+    t = _make_timebase(0.5, 2.5, 200.0)
+    assert (t0, n) == (0.5, 400)
+    assert np.array_equal(t, t0 + dt * np.arange(n))
+
+
 def test_make_timebase_errors():
     """
     _make_timebase should raise ValueError on invalid input parameters.
@@ -47,6 +79,99 @@ def test_make_timebase_errors():
         assert False, "Expected ValueError for t_end <= t_start"
     except ValueError:
         pass
+
+def test_affine_resample_matches_np_interp():
+    """
+    _affine_resample should agree with np.interp on the grid, including the fill region.
+    """
+    t = _make_timebase(0.0, 1.0, 50.0)
+    y = np.sin(2 * np.pi * 3.0 * t)
+    a, tau = 1.4, 0.2
+
+    y_fast = _affine_resample(y, t[0], t[1] - t[0], len(t), a, tau, fill=-2.0)
+    y_ref = np.interp(a * t - tau, t, y, left=-2.0, right=-2.0)
+
+    assert samples_equal(y_fast, y_ref)
+
+
+def test_interp_non_uniform_grid():
+    """
+    _interp should fall back to a searched interpolation matching np.interp when t is not uniform.
+    """
+    t = np.array([0.0, 0.1, 0.3, 0.35, 0.8, 1.0])
+    y = np.array([1.0, -1.0, 2.0, 0.5, 0.0, 3.0])
+    query = np.linspace(-0.1, 1.1, 61)
+
+    assert not _is_uniform(t)
+    assert _is_uniform(_make_timebase(0.0, 1.0, 50.0))
+    assert samples_equal(_interp(query, t, y, fill=7.0), np.interp(query, t, y, left=7.0, right=7.0))
+
+    # The transforms use the same fallback for non-uniform time vectors
+    ts, ys = time_shift_and_scale(t, y, tau=0.1, a=1.3, fill=7.0)
+    assert almost_equal(ts, t)
+    assert samples_equal(ys, np.interp(1.3 * t - 0.1, t, y, left=7.0, right=7.0))
+
+    ts, _ = time_shift(t, y, 0.2)
+    assert almost_equal(ts, t + 0.2)
+
+
+def test_single_sample_signal():
+    """
+    A length-1 signal keeps its value at t[0] and uses the fill value everywhere else, like np.interp.
+    """
+    t = np.array([0.0])
+    y = np.array([1.0])
+
+    _, ys = time_scale(t, y, 2.0, fill=-1.0)
+    assert samples_equal(ys, [1.0])
+
+    _, ys = time_shift_and_scale(t, y, tau=0.5, a=1.0, fill=-1.0)
+    assert samples_equal(ys, [-1.0])
+
+    query = np.array([-1.0, 0.0, 1.0])
+    assert samples_equal(_interp(query, t, y, fill=-1.0), np.interp(query, t, y, left=-1.0, right=-1.0))
+
+
+def test_is_uniform_with_large_time_offset():
+    """
+    A gap must be detected relative to the step, even when t carries an epoch-style offset.
+    """
+    # 1 Hz grid with a 10 s dropout, with and without an offset of 1.7e9 s
+    for offset in (0.0, 1.7e9):
+        t = offset + np.r_[np.arange(50.0), np.arange(60.0, 110.0)]
+        y = np.sin(0.3 * np.arange(t.size))
+        assert not _is_uniform(t)
+
+        _, ys = time_shift_and_scale(t, y, tau=5.0, a=1.0)
+        assert samples_equal(ys, np.interp(t - 5.0, t, y, left=0.0, right=0.0))
+
+    # Gap-free grids with the same offset are still uniform
+    assert _is_uniform(1.7e9 + np.arange(100.0))
+    assert _is_uniform(1.7e9 + 0.5 * np.arange(1000))
+
+
+def test_is_uniform_checks_every_step():
+    """
+    Grids that are only irregular in the middle must not take the uniform fast paths.
+    """
+    t = np.array([0.0, 1.0, 2.0, 2.5, 3.5, 5.0])
+    y = np.arange(6.0)
+    assert not _is_uniform(t)
+
+    ts, _ = time_shift(t, y, 1.0)
+    assert almost_equal(ts, t + 1.0)
+
+    _, ys = time_scale(t, y, 0.5)
+    assert samples_equal(ys, np.interp(0.5 * t, t, y, left=0.0, right=0.0))
+
+    # Jitter on the inner samples of an otherwise regular grid
+    rng = np.random.default_rng(0)
+    t = np.arange(100.0)
+    t[1:-1] += rng.uniform(-0.1, 0.1, 98)
+    t[1:3] = [1.0, 2.0]
+    assert not _is_uniform(t)
+
+
 # Signal Generator Tests
 def test_sine_signal_length_and_range():
     """
@@ -74,6 +199,27 @@ def test_triangle_signal_length_and_range():
     assert np.min(y) >= -amp - 1e-9
 
 
+def test_signals_are_cached_read_only():
+    """
+    Repeated calls with the same parameters return the same read-only arrays.
+    """
+    t_a, y_a = sine_signal(3.0, 0.0, 1.0, 1.0, 50.0)
+    t_b, y_b = sine_signal(3.0, 0.0, 1.0, 1.0, 50.0)
+    assert t_a is t_b and y_a is y_b
+    assert not t_a.flags.writeable and not y_a.flags.writeable
+
+    _, y_tri = triangle_signal(3.0, 0.0, 1.0, 1.0, 50.0)
+    try:
+        y_tri[0] = 5.0
+        assert False, "Expected cached triangle samples to be read-only"
+    except ValueError:
+        pass
+
+    # Different parameters give a fresh result
+    _, y_c = sine_signal(3.0, 0.0, 1.0, 2.0, 50.0)
+    assert y_c is not y_a
+
+
 # Time Transformation Tests
 def test_time_shift_pure_shift():
     """
@@ -87,6 +233,24 @@ def test_time_shift_pure_shift():
     assert np.array_equal(ys, y)
 
 
+def test_time_shift_returns_lazy_timebase():
+    """
+    time_shift should return a TimeBase that behaves like the shifted array.
+    """
+    t = _make_timebase(0.0, 1.0, 20.0)
+    ts, _ = time_shift(t, np.zeros_like(t), -0.5)
+
+    assert isinstance(ts, TimeBase)
+    assert len(ts) == len(t)
+    assert almost_equal(np.asarray(ts), t - 0.5)
+    assert math.isclose(ts[-1], t[-1] - 0.5, rel_tol=1e-12)
+    assert almost_equal(ts[2:5], t[2:5] - 0.5)
+
+    # Shifting a TimeBase again only moves its start
+    ts2, _ = time_shift(ts, np.zeros_like(t), 0.5)
+    assert ts2 == TimeBase(ts.t0 + 0.5, ts.dt, ts.n)
+
+
 def test_time_scale_basic():
     """
     Scaling by factor 'a' compresses or stretches the signal in time.
@@ -101,7 +265,7 @@ def test_time_scale_basic():
 
     # Values for t in [0, 0.5] should follow y=2t
     in_bounds = t <= 0.5 + 1e-12
-    assert almost_equal(ys[in_bounds], 2.0 * t[in_bounds])
+    assert samples_equal(ys[in_bounds], 2.0 * t[in_bounds])
     assert np.allclose(ys[~in_bounds], -1.0)  # Should match fill
 
 def test_time_shift_and_scale_equivalence():
@@ -119,15 +283,44 @@ def test_time_shift_and_scale_equivalence():
     y_expected = np.interp(query, t, y, left=0.0, right=0.0)
 
     assert almost_equal(tc, t)
-    assert almost_equal(yc, y_expected)
+    assert samples_equal(yc, y_expected)
     
+def test_transform_validation_errors():
+    """
+    The transforms should reject mismatched t/y lengths and a zero scaling factor.
+    """
+    t = np.linspace(0, 1, 11)
+    y = t.copy()
+    calls = [
+        lambda: time_shift(t, y[:-1], 0.1),
+        lambda: time_scale(t, y[:-1], 2.0),
+        lambda: time_scale(t, y, 0.0),
+        lambda: time_shift_and_scale(t, y, 0.1, 0.0),
+        lambda: time_shift_and_scale(t=t, y=y, tau=0.1, a=0),
+    ]
+    for call in calls:
+        try:
+            call()
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
 # Script Mode
 if __name__ == "__main__":
     test_make_timebase_basic()
+    test_make_timebase_length_is_exact()
     test_make_timebase_errors()
+    test_affine_resample_matches_np_interp()
+    test_interp_non_uniform_grid()
+    test_is_uniform_with_large_time_offset()
+    test_is_uniform_checks_every_step()
+    test_single_sample_signal()
     test_sine_signal_length_and_range()
     test_triangle_signal_length_and_range()
+    test_signals_are_cached_read_only()
     test_time_shift_pure_shift()
+    test_time_shift_returns_lazy_timebase()
     test_time_scale_basic()
     test_time_shift_and_scale_equivalence()
+    test_transform_validation_errors()
     print("Passed all test")
@@ -0,0 +1,83 @@
+import os
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+numba = pytest.importorskip("numba")
+
+# Wall-clock checks depend on the machine, so they only run when asked for
+pytestmark = pytest.mark.skipif(
+    os.environ.get("SIGNALS_PERF") != "1", reason="set SIGNALS_PERF=1 to run performance checks"
+)
+
+from signals import DTYPE, _affine_resample, _timebase_params
+
+# Problem size and timing settings for the regression check
+N = 1_000_000
+REPEATS = 7
+ATTEMPTS = 2
+
+# On a single core the parallel kernel and the serial reference compete for the same CPU
+MAX_SLOWDOWN = 2.0 if (os.cpu_count() or 1) > 1 else 4.0
+
+
+@numba.njit(cache=True)
+def ref_interp(q, t0, dt, y, fill):
+    """
+    Straightforward compiled linear interpolation on the grid t0 + k·dt, used as the speed reference.
+    """
+    n = y.shape[0]
+    out = np.empty_like(q)
+    for i in range(q.size):
+        pos = (q[i] - t0) / dt
+        if pos < 0.0 or pos > n - 1:
+            out[i] = fill
+        else:
+            idx = min(int(pos), n - 2)
+            frac = pos - idx
+            out[i] = y[idx] * (1.0 - frac) + y[idx + 1] * frac
+    return out
+
+
+def median_time(fn, *args):
+    """
+    Median wall time of fn(*args) over REPEATS runs, after one warm-up call.
+    """
+    fn(*args)
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def test_affine_resample_speed_vs_reference():
+    """
+    _affine_resample on 1e6 samples should match the reference kernel and be at most
+    MAX_SLOWDOWN times slower (median timings, retried once to ride out a noisy run).
+    """
+    t0, dt, n = _timebase_params(0.0, 1.0, float(N))
+    t = t0 + dt * np.arange(n)
+    y = np.sin(2 * np.pi * 7.0 * t).astype(DTYPE)
+    a, tau, fill = 1.37, 0.1234, 0.0
+
+    query = a * t - tau
+    y_ref = ref_interp(query, t0, dt, y, fill)
+    y_lib = _affine_resample(y, t0, dt, n, a, tau, fill)
+    assert np.allclose(y_lib, y_ref, rtol=1e-6, atol=1e-6)
+
+    for _ in range(ATTEMPTS):
+        t_ref = median_time(ref_interp, query, t0, dt, y, fill)
+        t_lib = median_time(_affine_resample, y, t0, dt, n, a, tau, fill)
+        if t_lib <= MAX_SLOWDOWN * t_ref:
+            break
+    assert t_lib <= MAX_SLOWDOWN * t_ref, f"_affine_resample took {t_lib:.4f}s vs reference {t_ref:.4f}s"
+
+
+# Script Mode
+if __name__ == "__main__":
+    test_affine_resample_speed_vs_reference()
+    print("Passed all test")